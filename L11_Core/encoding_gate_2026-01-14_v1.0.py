@@ -18,16 +18,144 @@ Based on: MANUS_HANDOFF_ENCODING_GATE_2026-01-14.md
 Consensus: 4/4 (Claude-Sonnet-4.5, Manus, Copilot, DeepSeek)
 """
 
+import hashlib
+import os
 import unicodedata
 import zlib
+from collections import OrderedDict, deque
+from functools import lru_cache
 from typing import Tuple
 from enum import Enum
 
 try:
-    import regex  # 支援 \p{Emoji}
+    import numpy as np  # byte-histogram 熵值 proxy（(e) 檢查）
+except ImportError:
+    np = None
+
+try:
+    import regex  # 權威 Emoji property 來源（\p{Emoji}，僅建表時使用）
 except ImportError:
     regex = None
-    print("Warning: 'regex' module not found. Emoji detection will be disabled.")
+
+try:
+    from simdutf import validate_utf8 as _validate_utf8  # SIMD UTF-8 驗證（AVX2/AVX-512/NEON）
+except ImportError:
+    _validate_utf8 = None
+
+try:
+    from encoding_gate_fast import scan_text as _scan_text_c  # Cython 加速融合掃描
+except ImportError:
+    _scan_text_c = None
+
+try:
+    import numba  # JIT 加速融合掃描（次於 Cython 的備選加速層）
+except ImportError:
+    numba = None
+
+
+# Emoji codepoint ranges：無 regex 時的近似 fallback
+# （UCD emoji-data Emoji property；權威來源為 _build_emoji_set 的
+# regex \p{Emoji} 路徑。刻意排除 ASCII 0-9 # *：keycap bases
+# 在無 VS/keycap 序列時視為一般文字，不計入 emoji 密度）
+_EMOJI_RANGES = (
+    (0x00A9, 0x00A9),    # Copyright
+    (0x00AE, 0x00AE),    # Registered
+    (0x203C, 0x203C),    # Double Exclamation
+    (0x2049, 0x2049),    # Exclamation Question
+    (0x2122, 0x2122),    # Trade Mark
+    (0x2139, 0x2139),    # Information
+    (0x2194, 0x2199),    # Arrows
+    (0x21A9, 0x21AA),    # Hooked arrows
+    (0x231A, 0x231B),    # Watch, Hourglass
+    (0x2328, 0x2328),    # Keyboard
+    (0x23CF, 0x23CF),    # Eject
+    (0x23E9, 0x23FA),    # Media control symbols
+    (0x24C2, 0x24C2),    # Circled M
+    (0x25AA, 0x25AB),    # Small squares
+    (0x25B6, 0x25B6),    # Play
+    (0x25C0, 0x25C0),    # Reverse
+    (0x25FB, 0x25FE),    # Medium/small squares
+    (0x2600, 0x27BF),    # Misc Symbols + Dingbats
+    (0x2934, 0x2935),    # Arrow curving up/down
+    (0x2B05, 0x2B07),    # Arrows
+    (0x2B1B, 0x2B1C),    # Large squares
+    (0x2B50, 0x2B50),    # Star
+    (0x2B55, 0x2B55),    # Circle
+    (0x3030, 0x3030),    # Wavy Dash
+    (0x303D, 0x303D),    # Part Alternation Mark
+    (0x3297, 0x3297),    # Circled Congratulations
+    (0x3299, 0x3299),    # Circled Secret
+    (0x1F000, 0x1F0FF),  # Mahjong, Dominoes, Playing Cards
+    (0x1F170, 0x1F171),  # A/B Button
+    (0x1F17E, 0x1F17F),  # O Button, P Button
+    (0x1F18E, 0x1F18E),  # AB Button
+    (0x1F191, 0x1F19A),  # Squared CL..VS
+    (0x1F1E6, 0x1F1FF),  # Regional Indicators
+    (0x1F201, 0x1F202),  # Squared Katakana
+    (0x1F21A, 0x1F21A),  # Squared CJK 無
+    (0x1F22F, 0x1F22F),  # Squared CJK 指
+    (0x1F232, 0x1F23A),  # Squared CJK ideographs
+    (0x1F250, 0x1F251),  # Circled CJK ideographs
+    (0x1F300, 0x1F5FF),  # Misc Symbols and Pictographs
+    (0x1F600, 0x1F64F),  # Emoticons
+    (0x1F680, 0x1F6FF),  # Transport and Map Symbols
+    (0x1F7E0, 0x1F7F0),  # Colored circles/squares
+    (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
+    (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
+)
+
+
+def _build_emoji_set() -> frozenset:
+    """
+    建立 Emoji codepoint set（僅建表時呼叫）
+
+    有 regex 時以 \p{Emoji}（UCD emoji-data）逐 codepoint 生成——
+    Emoji property 的 codepoints 全部 < 0x20000（BMP + SMP），
+    排除 ASCII（0-9 # * 等 keycap bases 不計入 emoji 密度）。
+    無 regex 時退回 _EMOJI_RANGES 近似表。
+    """
+    if regex is not None:
+        pat = regex.compile(r'\p{Emoji}')
+        return frozenset(
+            cp for cp in range(0x80, 0x20000) if pat.match(chr(cp))
+        )
+    return frozenset(
+        cp for lo, hi in _EMOJI_RANGES for cp in range(lo, hi + 1)
+    )
+
+# BMP 內所有可能使 NFC ≠ NFKC 的 codepoints：自身有 compatibility
+# decomposition，或（閉包）canonical 分解後任一字符有——
+# 如 U+1E9B 自身僅 canonical 分解為 U+017F，但 U+017F 為 compat
+_COMPAT_CODEPOINTS = frozenset(
+    cp for cp in range(0x10000)
+    if any(
+        unicodedata.decomposition(c).startswith('<')
+        for c in unicodedata.normalize('NFD', chr(cp))
+    )
+)
+
+# ASCII 非打印字符（含全部 C0 controls 與 DEL；space 為 printable）
+_ASCII_NONPRINT_DELETE = str.maketrans(
+    '', '', ''.join(map(chr, range(0x20))) + '\x7f'
+)
+
+# 非 ASCII 字符的 printability 查詢（記憶化，真實文字 codepoints 高度重複）
+_is_printable = lru_cache(maxsize=8192)(str.isprintable)
+
+
+def _count_non_printable(text: str) -> int:
+    """
+    計算非打印字符數
+
+    ASCII 控制字符以 str.translate 刪除表在 C 層一次掃完；
+    僅當剩餘部分含非 ASCII 字符時才逐字符（記憶化）檢查。
+    """
+    stripped = text.translate(_ASCII_NONPRINT_DELETE)
+    ascii_nonprint = len(text) - len(stripped)
+    if stripped.isascii():
+        return ascii_nonprint
+    isp = _is_printable
+    return ascii_nonprint + sum(1 for c in stripped if not isp(c))
 
 
 class EncodingUnmeasurableReason(Enum):
@@ -40,21 +168,217 @@ class EncodingUnmeasurableReason(Enum):
     ENTROPY_OUT_OF_BOUNDS = "SICT_ENTROPY_OUT_OF_BOUNDS"
 
 
+# per-codepoint bitmask 表：codepoint 直接索引，一次 memory load
+# 取代 unicodedata 的 binary search / frozenset hash probe
+_FLAG_UNASSIGNED = 1  # Unicode category 'Cn'
+_FLAG_EMOJI = 2       # Emoji codepoint
+_FLAG_COMPAT = 4      # compatibility-decomposable（僅 BMP）
+
+# encoding_gate_fast.scan_text 的 reason code → 原因代碼
+_C_REASON_CODES = {
+    1: "EMOJI_DENSITY_EXCEEDED",
+    2: "RANDOM_NOISE_SIGNATURE",
+}
+
+# 建表成本約 1 秒（1.1M 次 category 查詢），以磁碟快取攤提：
+# 首次 import 建表後寫入模組目錄，之後直接載入 ~1MB 原始 bytes
+
+# 建表規則版本：emoji/compat/unassigned 的建表邏輯變更時遞增，
+# 讓既有部署的舊快取自動失效重建
+_FLAGS_TABLE_VERSION = 2
+
+
+def _flags_cache_path() -> str:
+    """
+    快取檔名內嵌內容標籤：表格式版本 + UCD 版本 + emoji 定義 digest
+
+    任一定義變更都會改變檔名，舊快取不再符合、自動重建——
+    避免 stale cache 掩蓋對 _EMOJI_RANGES / _COMPAT_CODEPOINTS 的修改。
+    """
+    if regex is not None:
+        emoji_tag = f"re{regex.__version__}"
+    else:
+        emoji_tag = hashlib.blake2b(
+            repr(_EMOJI_RANGES).encode(), digest_size=4
+        ).hexdigest()
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        f"encoding_gate_flags_v{_FLAGS_TABLE_VERSION}"
+        f"_ucd{unicodedata.unidata_version}_{emoji_tag}.bin",
+    )
+
+
+_FLAGS_CACHE_PATH = _flags_cache_path()
+
+
+def _build_flags_table() -> bytes:
+    """建立 0x110000-entry flags 表"""
+    table = bytearray(0x110000)
+    category = unicodedata.category
+    for cp in range(0x110000):
+        if category(chr(cp)) == 'Cn':
+            table[cp] = _FLAG_UNASSIGNED
+    for cp in _build_emoji_set():
+        table[cp] |= _FLAG_EMOJI
+    for cp in _COMPAT_CODEPOINTS:
+        table[cp] |= _FLAG_COMPAT
+    return bytes(table)
+
+
+def _load_flags_table() -> bytes:
+    """載入（或建立並快取）flags 表；磁碟快取寫入失敗不影響運作"""
+    try:
+        with open(_FLAGS_CACHE_PATH, 'rb') as f:
+            table = f.read()
+        if len(table) == 0x110000:
+            return table
+    except OSError:
+        pass
+    table = _build_flags_table()
+    try:
+        with open(_FLAGS_CACHE_PATH, 'wb') as f:
+            f.write(table)
+    except OSError:
+        pass
+    return table
+
+
+_FLAGS_TABLE = _load_flags_table()
+
+# numba 掃描器以 uint8 ndarray view 索引同一張表（zero-copy）
+_FLAGS_ARR = np.frombuffer(_FLAGS_TABLE, dtype=np.uint8) if np is not None else None
+
+if numba is not None and np is not None:
+    @numba.njit(cache=True, boundscheck=False)
+    def _scan_codepoints_nb(cps, flags):
+        """融合掃描的 JIT 版本：輸入為 uint32 codepoint array"""
+        n = cps.shape[0]
+        emoji_threshold = int(n * 0.30) + 1
+        emoji_count = 0
+        consecutive_unknown = 0
+        has_compat = False
+        for i in range(n):
+            cp = cps[i]
+            f = flags[cp]
+            if cp >= 0x10000 or f & 4:   # _FLAG_COMPAT
+                has_compat = True
+            if f & 2:                    # _FLAG_EMOJI
+                emoji_count += 1
+                if emoji_count >= emoji_threshold:
+                    return 1, has_compat
+            if f & 1:                    # _FLAG_UNASSIGNED
+                consecutive_unknown += 1
+                if consecutive_unknown >= 3:
+                    return 2, has_compat
+            else:
+                consecutive_unknown = 0
+        return 0, has_compat
+else:
+    _scan_codepoints_nb = None
+
+
+def _scan_text(text: str) -> Tuple[str, bool]:
+    """
+    融合掃描（kernel fusion）：單次遍歷同時完成
+    (b) compat codepoint 偵測
+    (c) Emoji 密度（越過閾值立即短路）
+    (d) 連續 3+ unassigned codepoints（越過閾值立即短路）
+
+    text 只走一遍，對大於 L1 cache 的輸入可按比例減少 memory traffic。
+    非打印字符計數不在此處：僅 (b) 的罕見分支需要，
+    由 _count_non_printable 延遲計算（C 層 translate）。
+
+    Returns:
+        (reject_reason, has_compat)
+        - reject_reason: 掃描中觸發的原因代碼；"" 表示未觸發
+        - has_compat: 是否含 compatibility-decomposable codepoint
+
+    有編譯 encoding_gate_fast（Cython）時走 C 層掃描；
+    否則有 numba 時走 JIT 掃描；最後退回純 Python 迴圈，行為相同。
+    """
+    if _scan_text_c is not None:
+        reason, has_compat = _scan_text_c(text, _FLAGS_TABLE)
+        if reason:
+            return (
+                getattr(EncodingUnmeasurableReason, _C_REASON_CODES[reason]).value,
+                has_compat,
+            )
+        return "", has_compat
+
+    if _scan_codepoints_nb is not None:
+        # utf-32-le encode 將 str 攤平為 uint32 codepoint array，
+        # 之後整個掃描都在 JIT 機器碼中進行
+        cps = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        reason, has_compat = _scan_codepoints_nb(cps, _FLAGS_ARR)
+        if reason:
+            return (
+                getattr(EncodingUnmeasurableReason, _C_REASON_CODES[reason]).value,
+                bool(has_compat),
+            )
+        return "", bool(has_compat)
+
+    emoji_threshold = int(len(text) * 0.30) + 1
+    emoji_count = 0
+    consecutive_unknown = 0
+    has_compat = False
+
+    # 熱迴圈前提升為 local names（CPython LOAD_FAST）
+    # flags 表直接索引：每字符一次 bytes indexing，
+    # 取代 category 查詢 + 兩次 frozenset membership
+    flags = _FLAGS_TABLE
+    unassigned = _FLAG_UNASSIGNED
+    emoji_flag = _FLAG_EMOJI
+    compat_flag = _FLAG_COMPAT
+
+    for c in text:
+        cp = ord(c)
+        f = flags[cp]
+
+        if cp >= 0x10000 or f & compat_flag:
+            has_compat = True
+
+        if f & emoji_flag:
+            emoji_count += 1
+            if emoji_count >= emoji_threshold:
+                return (
+                    EncodingUnmeasurableReason.EMOJI_DENSITY_EXCEEDED.value,
+                    has_compat,
+                )
+
+        if f & unassigned:
+            consecutive_unknown += 1
+            if consecutive_unknown >= 3:
+                return (
+                    EncodingUnmeasurableReason.RANDOM_NOISE_SIGNATURE.value,
+                    has_compat,
+                )
+        else:
+            consecutive_unknown = 0
+
+    return "", has_compat
+
+
+# 結果快取：以 16-byte blake2b digest 為 key 的 LRU
+# （blake2b ~1 GB/s，遠快於完整掃描；重複輸入攤提為 O(1)）
+_GATE_CACHE_SIZE = 4096
+_gate_cache: "OrderedDict[bytes, Tuple[bool, str]]" = OrderedDict()
+
+
 def is_encoding_unmeasurable(input_bytes: bytes) -> Tuple[bool, str]:
     """
     Pre-Entropy Gate: 檢測編碼不可測量的輸入
-    
+
     Args:
         input_bytes: 原始輸入（bytes）
-    
+
     Returns:
         (is_unmeasurable, reason_code)
         - is_unmeasurable: True 表示輸入不可測量
         - reason_code: 原因代碼（EncodingUnmeasurableReason）
-    
-    Complexity: O(n)
+
+    Complexity: O(n)（重複輸入經 digest LRU cache 攤提為 O(1)）
     Performance: <10ms for 100KB input
-    
+
     Detection Criteria:
         (a) UTF-8 decoding failure
         (b) Normalization ambiguity (NFC ≠ NFKC 且非打印字符 >10%)
@@ -62,64 +386,142 @@ def is_encoding_unmeasurable(input_bytes: bytes) -> Tuple[bool, str]:
         (d) Random noise signature (連續 3+ 未知 codepoints)
         (e) zlib compression ratio bounds (<0.05 或 >1.5)
     """
-    
+    digest = hashlib.blake2b(input_bytes, digest_size=16).digest()
+    cached = _gate_cache.get(digest)
+    if cached is not None:
+        _gate_cache.move_to_end(digest)
+        return cached
+
+    result = _gate_uncached(input_bytes)
+
+    _gate_cache[digest] = result
+    if len(_gate_cache) > _GATE_CACHE_SIZE:
+        _gate_cache.popitem(last=False)
+    return result
+
+
+def _compression_ratio_out_of_bounds(input_bytes: bytes) -> bool:
+    """
+    (e) zlib compression ratio bounds
+
+    只對長輸入檢查（>= 100 bytes），避免 header overhead 影響。
+    只壓縮前 8KB 樣本（first-block heuristic）：
+    壓縮比作為 out-of-bounds 偵測器，8KB 已具統計代表性，
+    工作量由 O(n) 降為 O(min(n, 8KB))；level=1 較預設快 3-5x
+    且對極端值判斷的訊號幾乎相同。
+
+    註：byte-histogram Shannon entropy 不能替代此檢查——
+    直方圖對符號「順序」盲目（如 '0123456789' 重複的 H≈3.32，
+    永遠不會 < 1.0），看不見 LZ77 可壓縮的重複結構，
+    且 gate 判定不得因可選依賴（numpy）存在與否而改變。
+    """
+    if len(input_bytes) < 100:
+        return False
+    sample = input_bytes[:8192]
+
+    co = zlib.compressobj(level=1)
+    compressed_size = len(co.compress(sample)) + len(co.flush())
+    # compression_ratio = compressed_size / sample_size
+    # 正常文字：0.3 ~ 0.8
+    # 極度壓縮（重複字符）：< 0.05
+    # 無法壓縮（隨機噪音）：> 1.2
+    compression_ratio = compressed_size / len(sample)
+    return compression_ratio < 0.05 or compression_ratio > 1.2
+
+
+def _gate_uncached(input_bytes: bytes) -> Tuple[bool, str]:
+    """執行完整 (a)-(e) 檢測（無快取；經 is_encoding_unmeasurable 呼叫）"""
+
+    # ASCII fast path：純 ASCII 必為合法 UTF-8，且不可能觸發
+    # (b) normalization ambiguity、(c) emoji density、(d) unknown codepoints
+    # —— 只有 (e) 壓縮比檢查有意義。bytes.isascii() 為 C 實作的
+    # 單次線性掃描，直接跳過四個 Python-level 檢查
+    if input_bytes.isascii():
+        if _compression_ratio_out_of_bounds(input_bytes):
+            return True, EncodingUnmeasurableReason.ENTROPY_OUT_OF_BOUNDS.value
+        return False, EncodingUnmeasurableReason.OK.value
+
     # (a) UTF-8 decoding failure
-    try:
-        text = input_bytes.decode('utf-8', errors='strict')
-    except UnicodeDecodeError:
-        return True, EncodingUnmeasurableReason.UTF8_DECODE_FAILURE.value
+    # 優先使用 simdutf 的 SIMD 驗證器（8-15 GB/s）：
+    # 無效輸入直接拒絕，免去 scalar decode + str 分配
+    if _validate_utf8 is not None:
+        if not _validate_utf8(input_bytes):
+            return True, EncodingUnmeasurableReason.UTF8_DECODE_FAILURE.value
+        text = input_bytes.decode('utf-8')
+    else:
+        try:
+            text = input_bytes.decode('utf-8', errors='strict')
+        except UnicodeDecodeError:
+            return True, EncodingUnmeasurableReason.UTF8_DECODE_FAILURE.value
     
+    return _gate_checks(text, input_bytes)
+
+
+def _gate_from_str(text: str, input_bytes: bytes = None) -> Tuple[bool, str]:
+    """
+    str 入口：執行 (b)-(e) 檢測（經 digest LRU cache）
+
+    Python str 必為合法 Unicode，呼叫方持有 str 時（如 sic_kernel 的
+    calculate_entropy）直接走此入口，免去 gate 內 decode + (a) 的
+    重複驗證。快取與 bytes 入口共用同一 digest key，circuit breaker
+    重試 / replay 的重複輸入在兩個入口都攤提為 O(1)；
+    digest 所需的 encode 為單次 C 層 pass，遠低於它省下的完整掃描。
+
+    Args:
+        text: 輸入文字
+        input_bytes: text 的 UTF-8 編碼（若呼叫方已持有）
+    """
     # 空輸入視為可測量（熵值為 0）
     if len(text) == 0:
         return False, EncodingUnmeasurableReason.OK.value
-    
-    # (b) Normalization ambiguity
-    nfc = unicodedata.normalize('NFC', text)
-    nfkc = unicodedata.normalize('NFKC', text)
-    if nfc != nfkc:
-        non_printable_count = sum(1 for c in text if not c.isprintable())
-        non_printable_ratio = non_printable_count / len(text)
-        if non_printable_ratio > 0.10:
-            return True, EncodingUnmeasurableReason.NORMALIZATION_AMBIGUITY.value
-    
-    # (c) Emoji density > 30%
-    if regex is not None:
-        emoji_count = len(regex.findall(r'\p{Emoji}', text))
-        emoji_ratio = emoji_count / len(text)
-        if emoji_ratio > 0.30:
-            return True, EncodingUnmeasurableReason.EMOJI_DENSITY_EXCEEDED.value
-    
-    # (d) Random noise signature
-    # 連續 3+ codepoints 無已知 Unicode block
-    consecutive_unknown = 0
-    for char in text:
-        try:
-            # 嘗試獲取字符名稱
-            name = unicodedata.name(char, None)
-            if name is None:
-                consecutive_unknown += 1
-                if consecutive_unknown >= 3:
-                    return True, EncodingUnmeasurableReason.RANDOM_NOISE_SIGNATURE.value
-            else:
-                consecutive_unknown = 0
-        except ValueError:
-            # ValueError 表示無法獲取字符名稱
-            consecutive_unknown += 1
-            if consecutive_unknown >= 3:
-                return True, EncodingUnmeasurableReason.RANDOM_NOISE_SIGNATURE.value
-    
-    # (e) zlib compression ratio bounds
-    # 只對長文字檢查（>= 100 bytes），避免 header overhead 影響
-    if len(input_bytes) >= 100:
-        compressed = zlib.compress(input_bytes)
-        # compression_ratio = compressed_size / original_size
-        # 正常文字：0.3 ~ 0.8
-        # 極度壓縮（重複字符）：< 0.05
-        # 無法壓縮（隨機噪音）：> 1.2
-        compression_ratio = len(compressed) / len(input_bytes)
-        if compression_ratio < 0.05 or compression_ratio > 1.2:
+
+    if input_bytes is None:
+        input_bytes = text.encode('utf-8')
+
+    digest = hashlib.blake2b(input_bytes, digest_size=16).digest()
+    cached = _gate_cache.get(digest)
+    if cached is not None:
+        _gate_cache.move_to_end(digest)
+        return cached
+
+    result = _gate_checks(text, input_bytes)
+
+    _gate_cache[digest] = result
+    if len(_gate_cache) > _GATE_CACHE_SIZE:
+        _gate_cache.popitem(last=False)
+    return result
+
+
+def _gate_checks(text: str, input_bytes: bytes) -> Tuple[bool, str]:
+    """執行 (b)-(e) 檢測（無快取；text 已驗證非空、input_bytes 已編碼）"""
+
+    # ASCII fast path（str.isascii 同為 C 實作單次掃描）
+    if text.isascii():
+        if _compression_ratio_out_of_bounds(input_bytes):
             return True, EncodingUnmeasurableReason.ENTROPY_OUT_OF_BOUNDS.value
-    
+        return False, EncodingUnmeasurableReason.OK.value
+
+    # (b)(c)(d) 融合掃描：單次遍歷取代三次獨立掃描（見 _scan_text）
+    reject_reason, has_compat = _scan_text(text)
+    if reject_reason:
+        return True, reject_reason
+
+    # (b) Normalization ambiguity
+    # 只在掃描發現 compatibility-decomposable codepoint 時才 normalize：
+    # 沒有的話 NFC == NFKC 必然成立，可跳過兩次 O(n) normalize + 分配
+    # （ASCII / 多數 CJK 輸入直接走此捷徑；astral plane 字符保守處理）
+    if has_compat:
+        nfc = unicodedata.normalize('NFC', text)
+        nfkc = unicodedata.normalize('NFKC', text)
+        if nfc != nfkc:
+            non_printable_ratio = _count_non_printable(text) / len(text)
+            if non_printable_ratio > 0.10:
+                return True, EncodingUnmeasurableReason.NORMALIZATION_AMBIGUITY.value
+
+    # (e) zlib compression ratio bounds（見 _compression_ratio_out_of_bounds）
+    if _compression_ratio_out_of_bounds(input_bytes):
+        return True, EncodingUnmeasurableReason.ENTROPY_OUT_OF_BOUNDS.value
+
     return False, EncodingUnmeasurableReason.OK.value
 
 
@@ -185,11 +587,17 @@ class EncodingGateMetrics:
         - average_time_to_review_lockdown: <72h
     """
     
+    # LOCKDOWN 事件 ring buffer 上限：長駐服務不無限累積
+    LOCKDOWN_EVENTS_MAXLEN = 1024
+
     def __init__(self):
         self.total_inputs = 0
         self.unmeasurable_count = 0
         self.false_positive_count = 0
-        self.lockdown_events = []
+        # ring buffer + tuple 儲存：deque.append 為 O(1) 無 realloc 尖峰，
+        # tuple（~64 bytes）比 dict（~200 bytes）省 3x 記憶體，
+        # maxlen 淘汰最舊事件避免長駐服務 memory leak
+        self.lockdown_events = deque(maxlen=self.LOCKDOWN_EVENTS_MAXLEN)
     
     def record_input(self, is_unmeasurable: bool, is_false_positive: bool = False):
         """記錄輸入"""
@@ -199,12 +607,24 @@ class EncodingGateMetrics:
         if is_false_positive:
             self.false_positive_count += 1
     
+    def record_input_batch(self, is_unmeasurable_flags):
+        """
+        批次記錄輸入（搭配 calculate_entropy_batch）
+
+        整批一次更新計數器，取代逐筆 record_input 呼叫。
+
+        Args:
+            is_unmeasurable_flags: bool sequence 或 np.ndarray
+        """
+        self.total_inputs += len(is_unmeasurable_flags)
+        if np is not None and isinstance(is_unmeasurable_flags, np.ndarray):
+            self.unmeasurable_count += int(is_unmeasurable_flags.sum())
+        else:
+            self.unmeasurable_count += sum(map(bool, is_unmeasurable_flags))
+    
     def record_lockdown(self, incident_id: str, timestamp: str):
-        """記錄 LOCKDOWN 事件"""
-        self.lockdown_events.append({
-            "incident_id": incident_id,
-            "timestamp": timestamp
-        })
+        """記錄 LOCKDOWN 事件（存 (incident_id, timestamp) tuple）"""
+        self.lockdown_events.append((incident_id, timestamp))
     
     def get_false_positive_rate(self) -> float:
         """計算誤報率"""
@@ -291,6 +711,32 @@ def test_encoding_gate():
     print(f"Unmeasurable Count: {health['unmeasurable_count']}")
     print()
 
+    # Metrics 批次記錄與 ring buffer 測試
+    print("=" * 70)
+    print("Metrics Batch / Ring Buffer Test")
+    print("=" * 70)
+
+    batch_metrics = EncodingGateMetrics()
+    batch_metrics.record_input_batch([True, False, True])
+
+    if batch_metrics.total_inputs == 3 and batch_metrics.unmeasurable_count == 2:
+        print(f"✅ record_input_batch: total={batch_metrics.total_inputs}, unmeasurable={batch_metrics.unmeasurable_count}")
+    else:
+        print(f"❌ record_input_batch: total={batch_metrics.total_inputs}, unmeasurable={batch_metrics.unmeasurable_count} (expected 3/2)")
+
+    # 超出 maxlen 的 LOCKDOWN 事件應淘汰最舊的，長度固定不增長
+    overflow = EncodingGateMetrics.LOCKDOWN_EVENTS_MAXLEN + 100
+    for n in range(overflow):
+        batch_metrics.record_lockdown(f"INC-{n:05d}", "2026-01-14T00:00:00Z")
+
+    if (len(batch_metrics.lockdown_events) == EncodingGateMetrics.LOCKDOWN_EVENTS_MAXLEN
+            and batch_metrics.lockdown_events[0] == ("INC-00100", "2026-01-14T00:00:00Z")
+            and batch_metrics.lockdown_events[-1] == (f"INC-{overflow - 1:05d}", "2026-01-14T00:00:00Z")):
+        print(f"✅ Lockdown ring buffer capped at {len(batch_metrics.lockdown_events)}, oldest events evicted")
+    else:
+        print(f"❌ Lockdown ring buffer: len={len(batch_metrics.lockdown_events)}, head={batch_metrics.lockdown_events[0]}")
+    print()
+
 
 if __name__ == "__main__":
     test_encoding_gate()
@@ -0,0 +1,83 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Encoding Gate Fast Scanner - Cython 加速融合掃描
+
+Purpose:
+    encoding_gate 融合掃描（_scan_text）的 C 層實作。
+    直接以 PyUnicode_READ 走訪 codepoints，對照單一 flags 查找表，
+    完全消除 interpreter dispatch（~100ns/char → ~1ns/char）。
+
+Build:
+    python setup_encoding_gate_fast.py build_ext --inplace
+
+    編譯產物為可選加速器：encoding_gate 匯入失敗時
+    自動退回純 Python 實作，行為不變。
+
+Author: Manus (ENGINEERING)
+Date: 2026-08-27
+Version: v1.0
+License: MIT
+"""
+
+cdef extern from "Python.h":
+    void* PyUnicode_DATA(object o)
+    int PyUnicode_KIND(object o)
+    Py_UCS4 PyUnicode_READ(int kind, void* data, Py_ssize_t index)
+
+# flags 查找表 bitmask（由 encoding_gate 於 Python 側建表）
+DEF FLAG_UNASSIGNED = 1  # Unicode category 'Cn'
+DEF FLAG_EMOJI = 2       # Emoji codepoint
+DEF FLAG_COMPAT = 4      # compatibility-decomposable（僅 BMP）
+
+# reason codes（與 encoding_gate._scan_text 的對應見該模組）
+DEF REASON_NONE = 0
+DEF REASON_EMOJI_DENSITY = 1
+DEF REASON_RANDOM_NOISE = 2
+
+
+def scan_text(str text, const unsigned char[:] flags):
+    """
+    單次遍歷 text，回傳 (reason, has_compat)。
+
+    非打印字符計數不在此處：僅 normalization ambiguity 的罕見分支
+    需要，由 encoding_gate 以 C 層 translate 延遲計算。
+
+    Args:
+        text: 已通過 UTF-8 驗證的字串
+        flags: 長度 0x110000 的 per-codepoint bitmask 表
+
+    Returns:
+        reason: 0 = 未觸發, 1 = emoji density, 2 = random noise
+        has_compat: 是否含 compatibility-decomposable codepoint
+    """
+    cdef Py_ssize_t n = len(text)
+    cdef int kind = PyUnicode_KIND(text)
+    cdef void* data = PyUnicode_DATA(text)
+    cdef Py_ssize_t i
+    cdef Py_UCS4 cp
+    cdef unsigned char f
+    cdef Py_ssize_t emoji_threshold = <Py_ssize_t>(n * 0.30) + 1
+    cdef Py_ssize_t emoji_count = 0
+    cdef int consecutive_unknown = 0
+    cdef bint has_compat = False
+
+    for i in range(n):
+        cp = PyUnicode_READ(kind, data, i)
+        f = flags[cp]
+
+        if cp >= 0x10000 or (f & FLAG_COMPAT):
+            has_compat = True
+
+        if f & FLAG_EMOJI:
+            emoji_count += 1
+            if emoji_count >= emoji_threshold:
+                return REASON_EMOJI_DENSITY, has_compat
+
+        if f & FLAG_UNASSIGNED:
+            consecutive_unknown += 1
+            if consecutive_unknown >= 3:
+                return REASON_RANDOM_NOISE, has_compat
+        else:
+            consecutive_unknown = 0
+
+    return REASON_NONE, has_compat
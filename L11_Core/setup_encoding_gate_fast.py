@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Build script for encoding_gate_fast (Cython 加速融合掃描)
+
+Usage:
+    python setup_encoding_gate_fast.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="encoding_gate_fast",
+    ext_modules=cythonize("encoding_gate_fast.pyx"),
+)